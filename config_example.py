@@ -32,8 +32,13 @@ def setup_environment():
 
     # Authentication - uncomment ONE of the following:
 
+    # Check the key file once so the branches below agree
+    service_account_exists = bool(SERVICE_ACCOUNT_KEY_PATH) and os.path.exists(
+        SERVICE_ACCOUNT_KEY_PATH
+    )
+
     # Service Account (recommended)
-    if SERVICE_ACCOUNT_KEY_PATH and os.path.exists(SERVICE_ACCOUNT_KEY_PATH):
+    if service_account_exists:
         os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = SERVICE_ACCOUNT_KEY_PATH
         print(f"🔑 Using service account: {SERVICE_ACCOUNT_KEY_PATH}")
 
@@ -6,27 +6,71 @@ Supports both text-to-video and image-to-video generation
 
 import os
 import sys
+import argparse
 import time
+import asyncio
 import base64
-import requests
-from datetime import datetime
+import logging
+import mimetypes
+import random
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional
 from google import genai
 from google.genai.types import GenerateVideosConfig, Image
-from google.cloud import storage
-from google.oauth2.credentials import Credentials as AuthCredentials
-from google.cloud import aiplatform  # For aiplatform.init()
-import google.auth  # For exceptions
 
 # Configuration
 PROJECT_ID = "veo-testing"
 LOCATION_ID = "us-central1"
 MODEL_ID = "veo-3.0-generate-preview"
 GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY")
+MAX_CONCURRENT_GENERATIONS = 4  # Keep batch runs within Vertex AI quota
+MAX_PROMPT_FILE_SIZE = 64 * 1024  # Reject prompt files larger than 64 KiB
+MAX_BATCH_FILE_SIZE = 1024 * 1024  # Reject batch files larger than 1 MiB
+
+# GCS download tuning
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MiB, a multiple of 256 KiB
+PARALLEL_DOWNLOAD_THRESHOLD = 64 * 1024 * 1024  # gcloud or ranged GETs above 64 MiB
+PARALLEL_DOWNLOAD_WORKERS = 8
+GCLOUD_DOWNLOAD_TIMEOUT = 600  # Seconds before giving up on gcloud storage cp
+WRITE_CHUNK_SIZE = 1024 * 1024  # 1 MiB writes when saving video bytes
+
+log = logging.getLogger("veo")
+
+# ASCII characters that are not allowed in generated filenames
+_FILENAME_DELETE_TABLE = {
+    ord(c): None
+    for c in map(chr, range(128))
+    if not (c.isalnum() or c in (" ", "-", "_"))
+}
+
+# Image formats Veo accepts, checked before the general mimetypes lookup
+_IMAGE_MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+}
+mimetypes.init()
+
+
+def guess_image_mime_type(image_path: str) -> str:
+    """Return the MIME type for an image file, defaulting to JPEG."""
+    extension = os.path.splitext(image_path)[1].lower()
+    mime_type = _IMAGE_MIME_TYPES.get(extension)
+    if mime_type is None:
+        mime_type, _ = mimetypes.guess_type(image_path)
+    return mime_type or "image/jpeg"
 
 
 def initialize_genai():
     """Initialize Google GenAI client with Vertex AI settings."""
+    # Imported here so the CLI starts without loading the full Cloud SDK
+    from google.auth.exceptions import DefaultCredentialsError
+
     try:
         # Set environment variables for GenAI SDK to use Vertex AI
         os.environ["GOOGLE_CLOUD_PROJECT"] = PROJECT_ID
@@ -34,12 +78,20 @@ def initialize_genai():
         os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "True"
 
         access_token = os.environ.get("GOOGLE_ACCESS_TOKEN")
+        service_account_path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
+        service_account_exists = bool(service_account_path) and os.path.exists(
+            service_account_path
+        )
+        local_service_account_exists = os.path.exists("veo-service-account.json")
 
         if access_token:
             print("🔑 Using provided GOOGLE_ACCESS_TOKEN for authentication.")
             print(
                 "💡 Note: Access tokens are short-lived. This method is not suitable for long-running processes without token refresh logic."
             )
+            from google.cloud import aiplatform
+            from google.oauth2.credentials import Credentials as AuthCredentials
+
             creds_from_token = AuthCredentials(token=access_token)
             # Initialize aiplatform with these explicit credentials.
             # genai.Client() will then use this initialized aiplatform session.
@@ -50,13 +102,10 @@ def initialize_genai():
             # If no access token, set up for ADC/Service Account for aiplatform.
             # genai.Client() will internally call aiplatform.init(),
             # which will discover credentials from the environment.
-            os.environ["GOOGLE_CLOUD_PROJECT"] = PROJECT_ID
-            os.environ["GOOGLE_CLOUD_LOCATION"] = LOCATION_ID
             print("🔑 No GOOGLE_ACCESS_TOKEN found. Attempting authentication using:")
-            if os.environ.get("GOOGLE_APPLICATION_CREDENTIALS"):
-                service_account_path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
+            if service_account_path:
                 # Check if the path actually exists
-                if os.path.exists(service_account_path):
+                if service_account_exists:
                     print(
                         f"   - Service account via GOOGLE_APPLICATION_CREDENTIALS: {service_account_path}"
                     )
@@ -67,7 +116,7 @@ def initialize_genai():
                     print(
                         "     Falling back to Application Default Credentials (ADC) or other means."
                     )
-            elif os.path.exists("veo-service-account.json"):
+            elif local_service_account_exists:
                 # This part of the original script sets the env var.
                 os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = (
                     "veo-service-account.json"
@@ -86,7 +135,7 @@ def initialize_genai():
         )
         return client
 
-    except google.auth.exceptions.DefaultCredentialsError as e:
+    except DefaultCredentialsError as e:
         print(f"❌ Authentication Error: {e}")
         print(
             "💡 Please ensure your environment is authenticated correctly for Google Cloud and Vertex AI."
@@ -123,19 +172,113 @@ def initialize_genai():
 
 def generate_filename(prompt: str, extension: str = "mp4") -> str:
     """Generate a filename based on prompt and timestamp."""
-    # Clean the prompt for filename
-    clean_prompt = "".join(
-        c for c in prompt if c.isalnum() or c in (" ", "-", "_")
-    ).rstrip()
+    # Clean the prompt for filename (ASCII is handled in C by str.translate)
+    clean_prompt = prompt.translate(_FILENAME_DELETE_TABLE)
+    if not clean_prompt.isascii():
+        clean_prompt = "".join(
+            c for c in clean_prompt if c.isalnum() or c in (" ", "-", "_")
+        )
+    clean_prompt = clean_prompt.rstrip()
     clean_prompt = clean_prompt.replace(" ", "_")[:30]  # Limit length
 
-    # Add timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Add timestamp; microseconds keep same-second batch outputs distinct
+    seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    timestamp = "%s_%06d" % (
+        time.strftime("%Y%m%d_%H%M%S", time.localtime(seconds)),
+        nanoseconds // 1000,
+    )
     filename = f"{clean_prompt}_{timestamp}.{extension}"
 
     return filename
 
 
+# Resolved once; gcloud's sliced downloads beat the Python client on big blobs.
+# gcloud authenticates as its own CLI account, so it is only used when no
+# explicit credentials (access token or service account) are configured.
+_GCLOUD_PATH = shutil.which("gcloud")
+
+_GS_PREFIX = "gs://"
+_GS_PREFIX_LEN = len(_GS_PREFIX)
+
+_STORAGE_CLIENT = None
+_STORAGE_LOCK = threading.Lock()
+
+
+def _get_storage_client():
+    """Return the process-wide storage client, creating it on first use."""
+    global _STORAGE_CLIENT
+    if _STORAGE_CLIENT is None:
+        with _STORAGE_LOCK:
+            if _STORAGE_CLIENT is None:
+                from google.cloud import storage
+
+                _STORAGE_CLIENT = storage.Client()
+    return _STORAGE_CLIENT
+
+
+def _download_blob_ranges(blob, size: int, local_filename: str):
+    """Download a large blob as parallel ranged GETs into a preallocated file."""
+    with open(local_filename, "wb") as f:
+        f.truncate(size)
+
+    # Set on the first failed range so queued ranges are skipped instead of
+    # downloading data that will be thrown away
+    failed = threading.Event()
+
+    def _fetch_range(start: int):
+        if failed.is_set():
+            return
+        end = min(start + DOWNLOAD_CHUNK_SIZE, size) - 1
+        try:
+            data = blob.download_as_bytes(
+                start=start, end=end, raw_download=True, checksum=None
+            )
+            with open(local_filename, "r+b") as f:
+                f.seek(start)
+                f.write(data)
+        except BaseException:
+            failed.set()
+            raise
+
+    with ThreadPoolExecutor(max_workers=PARALLEL_DOWNLOAD_WORKERS) as pool:
+        # Consume the iterator so worker exceptions are raised here
+        list(pool.map(_fetch_range, range(0, size, DOWNLOAD_CHUNK_SIZE)))
+
+
+def _download_with_gcloud(gcs_uri: str, local_filename: str) -> bool:
+    """Copy a blob with ``gcloud storage cp``; return False if unavailable or failed."""
+    if _GCLOUD_PATH is None:
+        return False
+    if os.environ.get("GOOGLE_ACCESS_TOKEN") or os.environ.get(
+        "GOOGLE_APPLICATION_CREDENTIALS"
+    ):
+        # Keep downloads on the same identity initialize_genai set up
+        return False
+    try:
+        subprocess.run(
+            [_GCLOUD_PATH, "storage", "cp", "--quiet", gcs_uri, local_filename],
+            check=True,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=GCLOUD_DOWNLOAD_TIMEOUT,
+        )
+        return True
+    except (subprocess.SubprocessError, OSError) as e:
+        # e.g. gcloud needs reauth or cannot read the bucket; use the Python client
+        stderr = getattr(e, "stderr", None)
+        if isinstance(stderr, bytes):
+            # TimeoutExpired carries raw bytes even when text=True
+            stderr = stderr.decode(errors="replace")
+        if stderr:
+            log.debug(
+                "gcloud storage cp failed, falling back: %s\n%s", e, stderr.strip()
+            )
+        else:
+            log.debug("gcloud storage cp failed, falling back: %s", e)
+        return False
+
+
 def download_video_from_gcs(gcs_uri: str, local_filename: str) -> bool:
     """Download video from Google Cloud Storage URI to local file."""
     try:
@@ -147,21 +290,40 @@ def download_video_from_gcs(gcs_uri: str, local_filename: str) -> bool:
             return False
 
         # Parse GCS URI
-        if not gcs_uri.startswith("gs://"):
+        if not gcs_uri.startswith(_GS_PREFIX):
             print(f"❌ Invalid GCS URI: {gcs_uri}")
             return False
 
         # Remove gs:// prefix and split bucket/path
-        path_without_prefix = gcs_uri[5:]  # Remove 'gs://'
-        bucket_name, blob_name = path_without_prefix.split("/", 1)
+        bucket_name, _, blob_name = gcs_uri[_GS_PREFIX_LEN:].partition("/")
+        if not bucket_name or not blob_name:
+            print(f"❌ GCS URI has no bucket or object path: {gcs_uri}")
+            return False
 
-        # Initialize storage client
-        storage_client = storage.Client()
+        # Reuse the shared storage client and its connection pool
+        storage_client = _get_storage_client()
         bucket = storage_client.bucket(bucket_name)
-        blob = bucket.blob(blob_name)
+        blob = bucket.blob(blob_name, chunk_size=DOWNLOAD_CHUNK_SIZE)
+        blob.reload()  # Fetch size and content encoding
+
+        # Skip the decode pass unless the object is stored gzip-encoded
+        raw_download = blob.content_encoding != "gzip"
 
-        # Download to local file
-        blob.download_to_filename(local_filename)
+        # Download under a temporary name so a failed transfer never leaves
+        # a truncated video at local_filename
+        part_filename = local_filename + ".part"
+        try:
+            if raw_download and blob.size and blob.size > PARALLEL_DOWNLOAD_THRESHOLD:
+                if not _download_with_gcloud(gcs_uri, part_filename):
+                    _download_blob_ranges(blob, blob.size, part_filename)
+            else:
+                with open(part_filename, "wb") as f:
+                    blob.download_to_file(f, raw_download=raw_download, checksum=None)
+            os.replace(part_filename, local_filename)
+        except BaseException:
+            if os.path.exists(part_filename):
+                os.remove(part_filename)
+            raise
         print(f"✅ Video saved to: {local_filename}")
         return True
 
@@ -175,8 +337,16 @@ def save_video_data(video_data: bytes, local_filename: str) -> bool:
     try:
         print(f"💾 Saving video data to: {local_filename}")
 
-        with open(local_filename, "wb") as f:
-            f.write(video_data)
+        # Unbuffered writes straight from the source buffer, no extra copy
+        view = memoryview(video_data)
+        with open(local_filename, "wb", buffering=0) as f:
+            offset = 0
+            while offset < len(view):
+                offset += f.write(view[offset : offset + WRITE_CHUNK_SIZE])
+            # The video is not re-read here, so drop it from the page cache
+            if hasattr(os, "posix_fadvise"):
+                os.fdatasync(f.fileno())
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
 
         print(f"✅ Video saved to: {local_filename}")
         return True
@@ -186,8 +356,49 @@ def save_video_data(video_data: bytes, local_filename: str) -> bool:
         return False
 
 
-def get_user_choice():
+async def _poll_async(
+    client,
+    operation,
+    initial: float = 2.0,
+    cap: float = 30.0,
+    label: Optional[str] = None,
+):
+    """Poll a long-running operation with exponential backoff and jitter.
+
+    The blocking status GET runs in a worker thread so other generations
+    can make progress on the event loop in the meantime. ``label`` tags the
+    progress output so concurrent batch generations can be told apart.
+    """
+    tag = f"[{label}] " if label else ""
+    loop = asyncio.get_running_loop()
+    delay = initial
+    while not operation.done:
+        # Small random jitter keeps concurrent pollers from syncing up
+        await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
+        operation = await loop.run_in_executor(
+            None, client.operations.get, operation
+        )
+        print(f"⏳ {tag}Still generating video...")
+        delay = min(delay * 2, cap)
+    return operation
+
+
+def _is_interactive() -> bool:
+    """Return True when missing inputs can be asked for on a terminal."""
+    return sys.stdin.isatty()
+
+
+def get_user_choice(args=None):
     """Get user's choice for video generation method."""
+    if args is not None and args.image:
+        return "2"
+    if not _is_interactive():
+        # Without a terminal a prompt alone means text-to-video
+        if args is not None and (args.prompt or args.prompt_file):
+            return "1"
+        print("❌ No input given. Use --prompt, --prompt-file, --image or --batch.")
+        sys.exit(1)
+
     print("\n🎬 Welcome to AI Video Generator!")
     print("Choose your video generation method:")
     print("1. Text-to-Video (Generate video from text prompt)")
@@ -200,23 +411,47 @@ def get_user_choice():
         print("Invalid choice. Please enter 1 or 2.")
 
 
-def get_text_prompt():
-    """Get text prompt from user."""
+def read_prompt_file(path: str, max_size: int = MAX_PROMPT_FILE_SIZE) -> str:
+    """Read a prompt from a UTF-8 text file, rejecting oversized files."""
+    prompt_path = Path(path)
+    if prompt_path.stat().st_size > max_size:
+        print(f"❌ Prompt file is larger than {max_size} bytes: {prompt_path}")
+        sys.exit(1)
+    return prompt_path.read_text(encoding="utf-8")
+
+
+def get_text_prompt(args=None):
+    """Get text prompt from the command line or the user."""
     print("\n📝 Enter your video description:")
-    if len(sys.argv) > 1:
-        with open(sys.argv[1], "r") as file:
-            prompt = file.read()
+    if args is not None and args.prompt:
+        prompt = args.prompt.strip()
         print(f"Prompt: {prompt}")
-    else:
+    elif args is not None and args.prompt_file:
+        prompt = read_prompt_file(args.prompt_file).strip()
+        print(f"Prompt: {prompt}")
+    elif _is_interactive():
         prompt = input("Prompt: ").strip()
+    else:
+        prompt = ""
     while not prompt:
+        if not _is_interactive():
+            print("❌ No prompt given. Use --prompt or --prompt-file.")
+            sys.exit(1)
         print("Please enter a valid prompt.")
         prompt = input("Prompt: ").strip()
     return prompt
 
 
-def get_image_path():
-    """Get image path from user."""
+def get_image_path(args=None):
+    """Get image path from the command line or the user."""
+    if args is not None and args.image:
+        if not os.path.exists(args.image):
+            print(f"File not found: {args.image}")
+            return None
+        return args.image
+    if not _is_interactive():
+        return None
+
     print("\n🖼️  Enter the path to your image file:")
     image_path = input("Image path: ").strip()
 
@@ -229,50 +464,203 @@ def get_image_path():
     return image_path
 
 
-def get_generation_parameters():
-    """Get optional parameters for video generation."""
-    print("\n⚙️  Optional Parameters (press Enter to use defaults):")
-
-    # Duration
-    duration = input("Video duration in seconds (5-8, default: 5): ").strip()
-    if not duration:
-        duration = 5
+# (input prompt, parameter key, parser, validator, default) for each
+# optional generation parameter; empty or invalid input uses the default
+_GENERATION_PARAMETERS = [
+    (
+        "Video duration in seconds (5-8, default: 5)",
+        "duration",
+        int,
+        lambda value: 5 <= value <= 8,
+        5,
+    ),
+    (
+        "Aspect ratio (16:9 or 9:16, default: 16:9)",
+        "aspect_ratio",
+        str,
+        {"16:9", "9:16"}.__contains__,
+        "16:9",
+    ),
+    ("Negative prompt (what to avoid)", "negative_prompt", str, bool, None),
+    (
+        "Use enhanced prompts? (y/n, default: y)",
+        "enhance_prompt",
+        lambda raw: raw.lower() != "n",
+        lambda value: True,
+        True,
+    ),
+]
+
+
+def get_generation_parameters(args=None):
+    """Get optional parameters for video generation.
+
+    Values given on the command line are used as-is; the rest are asked
+    for interactively, or left at their defaults when there is no terminal.
+    """
+    interactive = _is_interactive()
+    if interactive:
+        print("\n⚙️  Optional Parameters (press Enter to use defaults):")
+
+    parameters = {}
+    for prompt_text, key, parse, is_valid, default in _GENERATION_PARAMETERS:
+        cli_value = getattr(args, key, None)
+        if cli_value is not None:
+            parameters[key] = cli_value
+            continue
+        if not interactive:
+            parameters[key] = default
+            continue
+
+        raw = input(f"{prompt_text}: ").strip()
+        value = default
+        if raw:
+            try:
+                value = parse(raw)
+                valid = is_valid(value)
+            except ValueError:
+                valid = False
+            if not valid:
+                print(f"Invalid value for {key}. Using default: {default}")
+                value = default
+        parameters[key] = value
+
+    return parameters
+
+
+def _save_b64_or_bytes(video_data, local_filename: str) -> bool:
+    """Save video data that may be base64-encoded text or raw bytes."""
+    if isinstance(video_data, str):
+        # Base64 encoded data
+        video_bytes = base64.b64decode(video_data)
     else:
-        try:
-            duration = int(duration)
-            if duration < 5 or duration > 8:
-                print("Duration must be between 5-8 seconds. Using default: 5")
-                duration = 5
-        except ValueError:
-            print("Invalid duration. Using default: 5")
-            duration = 5
-
-    # Aspect ratio
-    aspect_ratio = input("Aspect ratio (16:9 or 9:16, default: 16:9): ").strip()
-    if aspect_ratio not in ["16:9", "9:16"]:
-        aspect_ratio = "16:9"
-
-    # Negative prompt
-    negative_prompt = input("Negative prompt (what to avoid): ").strip()
-
-    # Enhanced prompt
-    enhance_prompt = input("Use enhanced prompts? (y/n, default: y): ").strip().lower()
-    enhance_prompt = enhance_prompt != "n"
-
-    return {
-        "duration": duration,
-        "aspect_ratio": aspect_ratio,
-        "negative_prompt": negative_prompt if negative_prompt else None,
-        "enhance_prompt": enhance_prompt,
-    }
-
-
-def generate_text_to_video(client, prompt: str, parameters: dict):
-    """Generate video from text prompt using Veo model."""
+        # Raw bytes
+        video_bytes = video_data
+    return save_video_data(video_bytes, local_filename)
+
+
+_MISSING = object()
+
+
+def _fields(obj, *names) -> dict:
+    """Snapshot an object's attributes as a dict for cheap repeated lookups.
+
+    Any of the given names not in ``vars(obj)`` (no ``__dict__``, or served
+    by a property or ``__getattr__`` as in proto-plus and pydantic extras)
+    are looked up with ``getattr`` and added to the returned copy.
+    """
+    if obj is None:
+        return {}
     try:
-        print(f"\n🎯 Generating video from text prompt...")
-        print(f"Prompt: {prompt}")
+        attrs = vars(obj)
+    except TypeError:
+        attrs = {}
+
+    missing = [name for name in names if name not in attrs]
+    if not missing:
+        return attrs
+
+    # Copy so the object's own __dict__ is never modified
+    fields = dict(attrs)
+    for name in missing:
+        value = getattr(obj, name, _MISSING)
+        if value is not _MISSING:
+            fields[name] = value
+    return fields
+
+
+def _save_generated_videos(generated_videos, local_filename: str) -> bool:
+    """Save the first entry of a ``generated_videos`` response list."""
+    log.debug("Found generated_videos: %d videos", len(generated_videos))
+    video_info = generated_videos[0]
+    info = _fields(video_info, "video", "video_data")
+    log.debug("Video info: %r", video_info)
+    log.debug("Video info type: %s", type(video_info))
+    log.debug("Video info attributes: %r", info)
+
+    video = info.get("video")
+    if video is not None:
+        video_fields = _fields(video, "video_bytes", "uri")
+
+        # Check if video has direct bytes data first
+        video_bytes = video_fields.get("video_bytes")
+        if video_bytes:
+            print("📹 Video data received directly (video_bytes)")
+            if not save_video_data(video_bytes, local_filename):
+                print("⚠️ Failed to save video data, but generation was successful")
+            return True
+
+        # Check if video has GCS URI
+        video_uri = video_fields.get("uri")
+        if video_uri:
+            print(f"📹 Video stored at: {video_uri}")
+            if not download_video_from_gcs(video_uri, local_filename):
+                print("⚠️ Failed to download video, but generation was successful")
+            return True
+
+        print("⚠️ Video object found but no video_bytes or valid uri")
+        log.debug("Video object attributes: %r", video_fields)
+        return True
 
+    if "video_data" in info:
+        # Video data returned directly
+        return _save_b64_or_bytes(info["video_data"], local_filename)
+
+    return False
+
+
+def _save_videos_array(videos, local_filename: str) -> bool:
+    """Save the first entry of an alternative ``videos`` response array."""
+    log.debug("Found videos array in result")
+    video_info = videos[0]
+    log.debug("Video from videos array: %r", video_info)
+    info = _fields(video_info, "gcsUri", "uri")
+    if "gcsUri" in info:
+        video_uri = info["gcsUri"]
+        print(f"📹 Video stored at (gcsUri): {video_uri}")
+    elif "uri" in info:
+        video_uri = info["uri"]
+        print(f"📹 Video stored at (uri): {video_uri}")
+    else:
+        return False
+    return bool(video_uri) and download_video_from_gcs(video_uri, local_filename)
+
+
+# Response shapes we know how to save, checked in order
+_HANDLERS = [
+    ("generated_videos", _save_generated_videos),
+    ("video_data", _save_b64_or_bytes),
+    ("videos", _save_videos_array),
+]
+
+
+def _extract_and_save(result, local_filename: str) -> bool:
+    """Save the video from an operation result, whichever shape it has."""
+    result_fields = _fields(result, *(name for name, _ in _HANDLERS))
+    for name, handler in _HANDLERS:
+        value = result_fields.get(name)
+        if value:
+            return handler(value, local_filename)
+
+    print("✅ Video generated successfully, but unable to retrieve video data")
+    print("💡 Check your GCS bucket or response format")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Available result attributes:")
+        for attr, value in result_fields.items():
+            log.debug("  - %s: %s = %r", attr, type(value), value)
+    return True
+
+
+async def _generate(
+    client,
+    prompt: str,
+    parameters: dict,
+    image_path: Optional[str] = None,
+    label: Optional[str] = None,
+):
+    """Run a Veo generation, wait for it, and save the resulting video."""
+    tag = f"[{label}] " if label else ""
+    try:
         # Create storage URI or set to None for response data
         output_gcs_uri = None
         if os.environ.get("GCS_BUCKET"):
@@ -280,284 +668,178 @@ def generate_text_to_video(client, prompt: str, parameters: dict):
 
         print("🔄 Starting video generation... This may take several minutes.")
 
-        # Create the video generation operation
-        operation = client.models.generate_videos(
-            model=MODEL_ID,
-            prompt=prompt,
-            config=GenerateVideosConfig(
+        # Blocking work (file and network I/O) runs in the default executor
+        # so concurrent generations keep polling while one of them waits
+        loop = asyncio.get_running_loop()
+
+        kwargs = {
+            "model": MODEL_ID,
+            "prompt": prompt,
+            "config": GenerateVideosConfig(
                 aspect_ratio=parameters["aspect_ratio"],
+                duration_seconds=parameters["duration"],
+                negative_prompt=parameters["negative_prompt"],
+                enhance_prompt=parameters["enhance_prompt"],
                 output_gcs_uri=output_gcs_uri,
             ),
+        }
+        if image_path:
+            # Create image object from file
+            mime_type = guess_image_mime_type(image_path)
+            image_bytes = await loop.run_in_executor(
+                None, Path(image_path).read_bytes
+            )
+            kwargs["image"] = Image(image_bytes=image_bytes, mime_type=mime_type)
+
+        # Create the video generation operation
+        operation = await loop.run_in_executor(
+            None, lambda: client.models.generate_videos(**kwargs)
         )
 
         # Poll for completion
-        while not operation.done:
-            time.sleep(15)
-            operation = client.operations.get(operation)
-            print("⏳ Still generating video...")
-
-        if operation.response:
-            print("✅ Video generation completed!")
-
-            # DEBUG: Print the full response structure
-            print("\n🔍 DEBUG - Response structure:")
-            print(f"operation.response: {operation.response}")
-            if hasattr(operation, "result"):
-                print(f"operation.result: {operation.result}")
-                print(f"operation.result type: {type(operation.result)}")
-                if hasattr(operation.result, "__dict__"):
-                    print(f"operation.result attributes: {operation.result.__dict__}")
-
-            # Generate local filename
-            local_filename = generate_filename(prompt)
-
-            # Handle the response
-            if (
-                hasattr(operation.result, "generated_videos")
-                and operation.result.generated_videos
-            ):
-                print(
-                    f"🔍 DEBUG - Found generated_videos: {len(operation.result.generated_videos)} videos"
-                )
-                video_info = operation.result.generated_videos[0]
-                print(f"🔍 DEBUG - Video info: {video_info}")
-                print(f"🔍 DEBUG - Video info type: {type(video_info)}")
-                if hasattr(video_info, "__dict__"):
-                    print(f"🔍 DEBUG - Video info attributes: {video_info.__dict__}")
-
-                if hasattr(video_info, "video") and video_info.video is not None:
-                    # Check if video has direct bytes data first
-                    if (
-                        hasattr(video_info.video, "video_bytes")
-                        and video_info.video.video_bytes
-                    ):
-                        print("📹 Video data received directly (video_bytes)")
-                        video_bytes = video_info.video.video_bytes
-                        if save_video_data(video_bytes, local_filename):
-                            return True
-                        else:
-                            print(
-                                "⚠️ Failed to save video data, but generation was successful"
-                            )
-                            return True
-
-                    # Check if video has GCS URI
-                    elif hasattr(video_info.video, "uri") and video_info.video.uri:
-                        video_uri = video_info.video.uri
-                        print(f"📹 Video stored at: {video_uri}")
-                        if download_video_from_gcs(video_uri, local_filename):
-                            return True
-                        else:
-                            print(
-                                "⚠️ Failed to download video, but generation was successful"
-                            )
-                            return True
-
-                    else:
-                        print("⚠️ Video object found but no video_bytes or valid uri")
-                        print(
-                            f"🔍 Video object attributes: {video_info.video.__dict__ if hasattr(video_info.video, '__dict__') else 'No __dict__'}"
-                        )
-                        return True
-
-                elif hasattr(video_info, "video_data"):
-                    # Video data returned directly
-                    video_data = video_info.video_data
-                    if isinstance(video_data, str):
-                        # Base64 encoded data
-                        video_bytes = base64.b64decode(video_data)
-                    else:
-                        # Raw bytes
-                        video_bytes = video_data
-
-                    return save_video_data(video_bytes, local_filename)
-
-            # Check if video data is in the response directly
-            elif hasattr(operation.result, "video_data"):
-                print("🔍 DEBUG - Found video_data directly in result")
-                video_data = operation.result.video_data
-                if isinstance(video_data, str):
-                    video_bytes = base64.b64decode(video_data)
-                else:
-                    video_bytes = video_data
-                return save_video_data(video_bytes, local_filename)
-
-            # Try alternative response structures
-            elif hasattr(operation.result, "videos") and operation.result.videos:
-                print("🔍 DEBUG - Found videos array in result")
-                video_info = operation.result.videos[0]
-                print(f"🔍 DEBUG - Video from videos array: {video_info}")
-                if hasattr(video_info, "gcsUri"):
-                    video_uri = video_info.gcsUri
-                    print(f"📹 Video stored at (gcsUri): {video_uri}")
-                    if video_uri and download_video_from_gcs(video_uri, local_filename):
-                        return True
-                elif hasattr(video_info, "uri"):
-                    video_uri = video_info.uri
-                    print(f"📹 Video stored at (uri): {video_uri}")
-                    if video_uri and download_video_from_gcs(video_uri, local_filename):
-                        return True
+        operation = await _poll_async(client, operation, label=label)
 
-            else:
-                print(
-                    "✅ Video generated successfully, but unable to retrieve video data"
-                )
-                print("💡 Check your GCS bucket or response format")
-                print("🔍 DEBUG - Available result attributes:")
-                if hasattr(operation.result, "__dict__"):
-                    for attr, value in operation.result.__dict__.items():
-                        print(f"  - {attr}: {type(value)} = {value}")
-                return True
-
-        else:
+        if not operation.response:
             print("❌ No response received from video generation")
             return False
 
+        print(f"✅ {tag}Video generation completed!")
+
+        # Log the full response structure when debugging
+        log.debug("operation.response: %r", operation.response)
+        if hasattr(operation, "result"):
+            log.debug("operation.result: %r", operation.result)
+            log.debug("operation.result type: %s", type(operation.result))
+            log.debug(
+                "operation.result attributes: %r",
+                getattr(operation.result, "__dict__", None),
+            )
+
+        # Generate local filename
+        name_prefix = f"image_to_video_{prompt}" if image_path else prompt
+        local_filename = generate_filename(name_prefix)
+
+        return await loop.run_in_executor(
+            None, _extract_and_save, operation.result, local_filename
+        )
+
     except Exception as e:
         print(f"❌ Error generating video: {e}")
         return False
 
 
-def generate_image_to_video(client, image_path: str, prompt: str, parameters: dict):
+async def generate_text_to_video(
+    client, prompt: str, parameters: dict, label: Optional[str] = None
+):
+    """Generate video from text prompt using Veo model."""
+    tag = f"[{label}] " if label else ""
+    print(f"\n🎯 {tag}Generating video from text prompt...")
+    print(f"Prompt: {prompt}")
+    return await _generate(client, prompt, parameters, label=label)
+
+
+async def generate_image_to_video(client, image_path: str, prompt: str, parameters: dict):
     """Generate video from image and text prompt using Veo model."""
-    try:
-        print(f"\n🎯 Generating video from image and text...")
-        print(f"Image: {image_path}")
-        print(f"Prompt: {prompt}")
+    print(f"\n🎯 Generating video from image and text...")
+    print(f"Image: {image_path}")
+    print(f"Prompt: {prompt}")
+    return await _generate(client, prompt, parameters, image_path=image_path)
+
+
+async def generate_many(
+    client,
+    prompts: list,
+    parameters: dict,
+    max_concurrent: int = MAX_CONCURRENT_GENERATIONS,
+) -> list:
+    """Generate one text-to-video per prompt, running up to max_concurrent at once."""
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def _generate_one(index: int, prompt: str):
+        async with semaphore:
+            return await generate_text_to_video(
+                client, prompt, parameters, label=f"{index}/{len(prompts)}"
+            )
 
-        # Create storage URI or set to None for response data
-        output_gcs_uri = None
-        if os.environ.get("GCS_BUCKET"):
-            output_gcs_uri = f"gs://{os.environ.get('GCS_BUCKET')}/videos/"
+    return await asyncio.gather(
+        *[_generate_one(i, p) for i, p in enumerate(prompts, start=1)]
+    )
 
-        print("🔄 Starting video generation... This may take several minutes.")
 
-        # Create image object from file
-        mime_type = "image/png" if image_path.lower().endswith(".png") else "image/jpeg"
+def get_batch_prompts(path: str) -> list:
+    """Read one prompt per non-empty line from a batch file."""
+    text = read_prompt_file(path, max_size=MAX_BATCH_FILE_SIZE)
+    return [line.strip() for line in text.splitlines() if line.strip()]
 
-        # Create the video generation operation
-        operation = client.models.generate_videos(
-            model=MODEL_ID,
-            prompt=prompt,
-            image=Image(
-                gcs_uri=None,  # We'll use local file path for now
-                mime_type=mime_type,
-            ),
-            config=GenerateVideosConfig(
-                aspect_ratio=parameters["aspect_ratio"],
-                output_gcs_uri=output_gcs_uri,
-            ),
-        )
 
-        # Poll for completion
-        while not operation.done:
-            time.sleep(15)
-            operation = client.operations.get(operation)
-            print("⏳ Still generating video...")
-
-        if operation.response:
-            print("✅ Video generation completed!")
-
-            # DEBUG: Print the full response structure
-            print("\n🔍 DEBUG - Response structure:")
-            print(f"operation.response: {operation.response}")
-            if hasattr(operation, "result"):
-                print(f"operation.result: {operation.result}")
-                print(f"operation.result type: {type(operation.result)}")
-                if hasattr(operation.result, "__dict__"):
-                    print(f"operation.result attributes: {operation.result.__dict__}")
-
-            # Generate local filename
-            local_filename = generate_filename(f"image_to_video_{prompt}")
-
-            # Handle the response
-            if (
-                hasattr(operation.result, "generated_videos")
-                and operation.result.generated_videos
-            ):
-                print(
-                    f"🔍 DEBUG - Found generated_videos: {len(operation.result.generated_videos)} videos"
-                )
-                video_info = operation.result.generated_videos[0]
-                print(f"🔍 DEBUG - Video info: {video_info}")
-                print(f"🔍 DEBUG - Video info type: {type(video_info)}")
-                if hasattr(video_info, "__dict__"):
-                    print(f"🔍 DEBUG - Video info attributes: {video_info.__dict__}")
-
-                if hasattr(video_info, "video") and video_info.video is not None:
-                    # Check if video has direct bytes data first
-                    if (
-                        hasattr(video_info.video, "video_bytes")
-                        and video_info.video.video_bytes
-                    ):
-                        print("📹 Video data received directly (video_bytes)")
-                        video_bytes = video_info.video.video_bytes
-                        if save_video_data(video_bytes, local_filename):
-                            return True
-                        else:
-                            print(
-                                "⚠️ Failed to save video data, but generation was successful"
-                            )
-                            return True
-
-                    # Check if video has GCS URI
-                    elif hasattr(video_info.video, "uri") and video_info.video.uri:
-                        video_uri = video_info.video.uri
-                        print(f"📹 Video stored at: {video_uri}")
-                        if download_video_from_gcs(video_uri, local_filename):
-                            return True
-                        else:
-                            print(
-                                "⚠️ Failed to download video, but generation was successful"
-                            )
-                            return True
-
-                    else:
-                        print("⚠️ Video object found but no video_bytes or valid uri")
-                        print(
-                            f"🔍 Video object attributes: {video_info.video.__dict__ if hasattr(video_info.video, '__dict__') else 'No __dict__'}"
-                        )
-                        return True
-
-                elif hasattr(video_info, "video_data"):
-                    # Video data returned directly
-                    video_data = video_info.video_data
-                    if isinstance(video_data, str):
-                        # Base64 encoded data
-                        video_bytes = base64.b64decode(video_data)
-                    else:
-                        # Raw bytes
-                        video_bytes = video_data
-
-                    return save_video_data(video_bytes, local_filename)
-
-            # Check if video data is in the response directly
-            elif hasattr(operation.result, "video_data"):
-                video_data = operation.result.video_data
-                if isinstance(video_data, str):
-                    video_bytes = base64.b64decode(video_data)
-                else:
-                    video_bytes = video_data
-                return save_video_data(video_bytes, local_filename)
+def run_batch(client, path: str, args=None):
+    """Generate videos for every prompt in a batch file concurrently."""
+    prompts = get_batch_prompts(path)
+    if not prompts:
+        print(f"❌ No prompts found in batch file: {path}")
+        sys.exit(1)
 
-            else:
-                print(
-                    "✅ Video generated successfully, but unable to retrieve video data"
-                )
-                print("💡 Check your GCS bucket or response format")
-                return True
+    parameters = get_generation_parameters(args)
 
-        else:
-            print("❌ No response received from video generation")
-            return False
+    print(
+        f"\n📚 Generating {len(prompts)} videos "
+        f"({MAX_CONCURRENT_GENERATIONS} at a time)..."
+    )
+    results = asyncio.run(generate_many(client, prompts, parameters))
+
+    succeeded = sum(1 for r in results if r)
+    print(f"\n🎉 Batch completed: {succeeded}/{len(prompts)} videos generated.")
+    if succeeded < len(prompts):
+        sys.exit(1)
 
-    except Exception as e:
-        print(f"❌ Error generating video: {e}")
-        return False
+
+def parse_args(argv=None):
+    """Parse command-line options; anything omitted is asked for interactively."""
+    parser = argparse.ArgumentParser(
+        description="Generate videos with Google's Veo models."
+    )
+    parser.add_argument(
+        "legacy_prompt_file",
+        nargs="?",
+        metavar="PROMPT_FILE",
+        help="text file containing the prompt (same as --prompt-file)",
+    )
+    parser.add_argument("--prompt", help="text prompt describing the video")
+    parser.add_argument("--prompt-file", help="text file containing the prompt")
+    parser.add_argument("--image", help="image file for image-to-video generation")
+    parser.add_argument(
+        "--duration", type=int, choices=range(5, 9), help="video duration in seconds"
+    )
+    parser.add_argument(
+        "--aspect-ratio", choices=["16:9", "9:16"], help="video aspect ratio"
+    )
+    parser.add_argument("--negative-prompt", help="what to avoid in the video")
+    parser.add_argument(
+        "--no-enhance",
+        dest="enhance_prompt",
+        action="store_const",
+        const=False,
+        help="disable prompt enhancement",
+    )
+    parser.add_argument(
+        "--batch", metavar="FILE", help="generate one video per line of FILE"
+    )
+
+    args = parser.parse_args(argv)
+    args.prompt_file = args.prompt_file or args.legacy_prompt_file
+    return args
 
 
 def main():
     """Main function to orchestrate the video generation process."""
+    args = parse_args()
+
+    # Set VEO_DEBUG=1 to see the raw API responses; only this script's
+    # logger is raised so SDK and HTTP libraries stay at WARNING
+    logging.basicConfig(format="🔍 %(levelname)s - %(message)s")
+    if os.environ.get("VEO_DEBUG"):
+        log.setLevel(logging.DEBUG)
+
     print("🚀 AI Video Generator using Google's Veo Models")
 
     # Initialize GenAI client
@@ -566,25 +848,32 @@ def main():
         sys.exit(1)
 
     try:
+        # Batch mode: python generate_video.py --batch prompts.txt
+        if args.batch:
+            run_batch(client, args.batch, args)
+            return
+
         # Get user choice
-        choice = get_user_choice()
+        choice = get_user_choice(args)
 
         # Get generation parameters
-        parameters = get_generation_parameters()
+        parameters = get_generation_parameters(args)
 
         if choice == "1":
             # Text-to-Video
-            prompt = get_text_prompt()
-            success = generate_text_to_video(client, prompt, parameters)
+            prompt = get_text_prompt(args)
+            success = asyncio.run(generate_text_to_video(client, prompt, parameters))
         else:
             # Image-to-Video
-            image_path = get_image_path()
+            image_path = get_image_path(args)
             if not image_path:
                 print("❌ No image provided. Exiting.")
                 sys.exit(1)
 
-            prompt = get_text_prompt()
-            success = generate_image_to_video(client, image_path, prompt, parameters)
+            prompt = get_text_prompt(args)
+            success = asyncio.run(
+                generate_image_to_video(client, image_path, prompt, parameters)
+            )
 
         if success:
             print("\n🎉 Video generation process completed successfully!")
@@ -3,20 +3,26 @@
 Setup script for AI Video Generator
 """
 
+import shutil
 import subprocess
 import sys
 import os
 
-def run_command(command):
-    """Run a shell command and return True if successful."""
+def run_command(cmd):
+    """Run a command (list of arguments) and return True if successful."""
+    command = " ".join(cmd)
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        subprocess.run(cmd, check=True, capture_output=True, text=True)
         print(f"✅ {command}")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ Failed to run: {command}")
         print(f"Error: {e.stderr}")
         return False
+    except OSError as e:
+        print(f"❌ Failed to run: {command}")
+        print(f"Error: {e}")
+        return False
 
 def main():
     """Main setup function."""
@@ -32,16 +38,21 @@ def main():
     
     # Install requirements
     print("\n📦 Installing Python dependencies...")
-    if not run_command("pip3 install -r requirements.txt"):
+    if not run_command([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"]):
         print("❌ Failed to install dependencies")
         sys.exit(1)
     
     # Check Google Cloud authentication
     print("\n🔐 Checking Google Cloud authentication...")
-    result = subprocess.run("gcloud auth list --filter=status:ACTIVE --format='value(account)'", 
-                           shell=True, capture_output=True, text=True)
+    try:
+        # which() resolves gcloud.cmd on Windows, where there is no shell to do it
+        gcloud = shutil.which("gcloud") or "gcloud"
+        result = subprocess.run([gcloud, "auth", "list", "--filter=status:ACTIVE", "--format=value(account)"],
+                               capture_output=True, text=True)
+    except OSError:
+        result = None  # gcloud is not installed
     
-    if result.returncode == 0 and result.stdout.strip():
+    if result and result.returncode == 0 and result.stdout.strip():
         print(f"✅ Authenticated as: {result.stdout.strip()}")
     else:
         print("⚠️  No active Google Cloud authentication found")